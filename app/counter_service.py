@@ -1,8 +1,49 @@
-from datetime import datetime
 from typing import Optional
-from sqlmodel import select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, asc, col, select, update
 from app.database import get_session
-from app.models import Counter, CounterCreate, CounterUpdate
+from app.models import Counter, CounterCreate, CounterUpdate, CounterView
+
+# Id of the default counter, cached after the first lookup
+_default_id: Optional[int] = None
+
+# Constant payload for reset_counter; update_counter only reads it
+_RESET_PAYLOAD = CounterUpdate(value=0)
+
+
+def _upsert_default_counter(session: Session) -> Optional[Counter]:
+    """Insert the default counter unless it exists; returns the new row, or None if it was already there."""
+    match session.get_bind().dialect.name:
+        case "sqlite":
+            insert = sqlite.insert
+        case _:
+            insert = postgresql.insert
+
+    statement = (
+        insert(Counter)
+        .values(name="default", value=0)
+        .on_conflict_do_nothing(index_elements=["name"])
+        .returning(Counter)
+    )
+    return session.scalars(statement).first()
+
+
+def _add_to_counter(counter_id: int, delta: int) -> Optional[CounterView]:
+    """Atomically add delta to a counter; returns only the new value and timestamp, or None if it does not exist."""
+    with get_session() as session:
+        # Returning plain columns skips building a Counter for the hottest path (every +/- click)
+        statement = (
+            update(Counter)
+            .where(col(Counter.id) == counter_id)
+            .values(value=Counter.value + delta)
+            .returning(col(Counter.value), col(Counter.updated_at))
+        )
+        row = session.exec(statement).first()  # type: ignore[call-overload]
+        session.commit()
+        if row is None:
+            return None
+        return CounterView(*row)
 
 
 class CounterService:
@@ -11,16 +52,23 @@ class CounterService:
     @staticmethod
     def get_or_create_default_counter() -> Counter:
         """Get the default counter or create it if it doesn't exist."""
+        global _default_id
+
         with get_session() as session:
-            statement = select(Counter).where(Counter.name == "default")
-            counter = session.exec(statement).first()
+            if _default_id is not None:
+                counter = session.get(Counter, _default_id)
+                # The cached id may be stale if the table was wiped and re-populated
+                if counter is not None and counter.name == "default":
+                    return counter
 
+            # A single INSERT ... ON CONFLICT DO NOTHING is race-free across concurrent first visits
+            counter = _upsert_default_counter(session)
             if counter is None:
-                counter = Counter(name="default", value=0)
-                session.add(counter)
-                session.commit()
-                session.refresh(counter)
+                statement = select(Counter).where(Counter.name == "default")
+                counter = session.scalars(statement).one()
 
+            session.commit()
+            _default_id = counter.id
             return counter
 
     @staticmethod
@@ -29,64 +77,58 @@ class CounterService:
         with get_session() as session:
             return session.get(Counter, counter_id)
 
+    @staticmethod
+    def list_counters() -> list[Counter]:
+        """Get all counters in one query. List views should use this rather than calling get_counter per id."""
+        with get_session() as session:
+            return list(session.scalars(select(Counter).order_by(asc(Counter.id))).all())
+
     @staticmethod
     def create_counter(counter_data: CounterCreate) -> Counter:
-        """Create a new counter."""
+        """Create a new counter. Raises ValueError if a counter with the same name exists."""
         with get_session() as session:
             counter = Counter(name=counter_data.name, value=counter_data.value)
             session.add(counter)
-            session.commit()
-            session.refresh(counter)
+            try:
+                session.commit()
+            except IntegrityError as e:
+                session.rollback()
+                raise ValueError(f"Counter '{counter_data.name}' already exists") from e
             return counter
 
     @staticmethod
-    def increment_counter(counter_id: int) -> Optional[Counter]:
+    def increment_counter(counter_id: int) -> Optional[CounterView]:
         """Increment counter value by 1."""
-        with get_session() as session:
-            counter = session.get(Counter, counter_id)
-            if counter is None:
-                return None
-
-            counter.value += 1
-            counter.updated_at = datetime.utcnow()
-            session.add(counter)
-            session.commit()
-            session.refresh(counter)
-            return counter
+        return _add_to_counter(counter_id, 1)
 
     @staticmethod
-    def decrement_counter(counter_id: int) -> Optional[Counter]:
+    def decrement_counter(counter_id: int) -> Optional[CounterView]:
         """Decrement counter value by 1."""
-        with get_session() as session:
-            counter = session.get(Counter, counter_id)
-            if counter is None:
-                return None
-
-            counter.value -= 1
-            counter.updated_at = datetime.utcnow()
-            session.add(counter)
-            session.commit()
-            session.refresh(counter)
-            return counter
+        return _add_to_counter(counter_id, -1)
 
     @staticmethod
     def update_counter(counter_id: int, counter_data: CounterUpdate) -> Optional[Counter]:
         """Update counter with new data."""
         with get_session() as session:
-            counter = session.get(Counter, counter_id)
-            if counter is None:
-                return None
+            if counter_data.value is None:
+                return session.get(Counter, counter_id)
 
-            if counter_data.value is not None:
-                counter.value = counter_data.value
-                counter.updated_at = datetime.utcnow()
-                session.add(counter)
-                session.commit()
-                session.refresh(counter)
+            # Only write when the value actually changes
+            statement = (
+                update(Counter)
+                .where(col(Counter.id) == counter_id, col(Counter.value) != counter_data.value)
+                .values(value=counter_data.value)
+                .returning(Counter)
+            )
+            counter = session.scalars(statement).first()
+            if counter is None:
+                # Either the counter does not exist or it already holds this value
+                return session.get(Counter, counter_id)
 
+            session.commit()
             return counter
 
     @staticmethod
     def reset_counter(counter_id: int) -> Optional[Counter]:
         """Reset counter value to 0."""
-        return CounterService.update_counter(counter_id, CounterUpdate(value=0))
+        return CounterService.update_counter(counter_id, _RESET_PAYLOAD)
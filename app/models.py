@@ -1,5 +1,5 @@
 from sqlmodel import SQLModel, Field
-from typing import Optional
+from typing import NamedTuple, Optional
 from datetime import datetime
 
 
@@ -9,10 +9,11 @@ class Counter(SQLModel, table=True):
     __tablename__ = "counters"  # type: ignore[assignment]
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    name: str = Field(max_length=100, default="default")
+    name: str = Field(max_length=100, default="default", unique=True, index=True)
     value: int = Field(default=0)
     created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    # Also stamped by SQLAlchemy on every UPDATE it emits, including the atomic ones in CounterService
+    updated_at: datetime = Field(default_factory=datetime.utcnow, sa_column_kwargs={"onupdate": datetime.utcnow})
 
 
 class CounterCreate(SQLModel, table=False):
@@ -26,3 +27,10 @@ class CounterUpdate(SQLModel, table=False):
     """Schema for updating counter value."""
 
     value: Optional[int] = Field(default=None)
+
+
+class CounterView(NamedTuple):
+    """Display-only snapshot of a counter, read without loading the ORM object."""
+
+    value: int
+    updated_at: datetime
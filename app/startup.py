@@ -6,7 +6,11 @@ import app.counter_ui
 def startup() -> None:
     # this function is called before the first request
     create_tables()
+    register_pages()
 
+
+def register_pages() -> None:
+    """Register all UI pages; schema setup is left to startup()."""
     # Register counter UI module
     app.counter_ui.create()
 
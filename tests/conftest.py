@@ -1,12 +1,105 @@
-from typing import Generator
+import os
+from datetime import datetime
+from typing import Callable, Generator
 import pytest
-from app.startup import startup
+from sqlalchemy import Engine, create_engine, text
+from sqlmodel import Session
+from app.counter_ui import COUNTER_VALUE
+from app.database import ENGINE, get_session, reset_db, session_scope
+from app.startup import register_pages
+from nicegui import ui
 from nicegui.testing import User
 
 pytest_plugins = ["nicegui.testing.plugin"]
 
 
+def _create_worker_database(engine: Engine) -> None:
+    """Create the per-worker database that app.database points at under pytest-xdist."""
+    admin = create_engine(engine.url.set(database="postgres"), isolation_level="AUTOCOMMIT")
+    try:
+        with admin.connect() as connection:
+            exists = connection.execute(
+                text("SELECT 1 FROM pg_database WHERE datname = :name"), {"name": engine.url.database}
+            ).first()
+            if exists is None:
+                connection.execute(text(f'CREATE DATABASE "{engine.url.database}"'))
+    finally:
+        admin.dispose()
+
+
+def _drop_worker_database(engine: Engine) -> None:
+    """Remove the per-worker database once the worker has finished its tests."""
+    engine.dispose()
+    if engine.dialect.name == "sqlite":
+        if engine.url.database and os.path.exists(engine.url.database):
+            os.remove(engine.url.database)
+        return
+    admin = create_engine(engine.url.set(database="postgres"), isolation_level="AUTOCOMMIT")
+    try:
+        with admin.connect() as connection:
+            connection.execute(text(f'DROP DATABASE IF EXISTS "{engine.url.database}"'))
+    finally:
+        admin.dispose()
+
+
+@pytest.fixture(scope="session")
+def engine() -> Generator[Engine, None, None]:
+    """Build a fresh schema once for the whole test run."""
+    worker_database = bool(os.environ.get("PYTEST_XDIST_WORKER")) and ENGINE.url.database not in (None, "", ":memory:")
+    if worker_database and ENGINE.dialect.name == "postgresql":
+        _create_worker_database(ENGINE)
+    reset_db()
+    yield ENGINE
+    if worker_database:
+        _drop_worker_database(ENGINE)
+
+
+@pytest.fixture()
+def new_db(engine: Engine) -> Generator[None, None, None]:
+    """Run the test inside a transaction that is rolled back afterwards."""
+    connection = engine.connect()
+    transaction = connection.begin()
+    # Commits made by the service layer only release a savepoint inside the outer transaction
+    session = Session(bind=connection, join_transaction_mode="create_savepoint", expire_on_commit=False)
+
+    with session_scope(session):
+        yield
+
+    session.close()
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture()
+def seed_counter(new_db: None) -> Callable[[str, int], int]:
+    """Insert a counter row with plain SQL inside the test transaction and return its id."""
+
+    def seed(name: str, value: int) -> int:
+        with get_session() as session:
+            # Timestamps are naive UTC, like the model's datetime.utcnow defaults
+            now = datetime.utcnow()
+            statement = text(
+                "INSERT INTO counters (name, value, created_at, updated_at) "
+                "VALUES (:name, :value, :now, :now) RETURNING id"
+            ).bindparams(name=name, value=value, now=now)
+            return session.exec(statement).scalar_one()  # type: ignore[call-overload]
+
+    return seed
+
+
 @pytest.fixture
-def user(user: User) -> Generator[User, None, None]:
-    startup()
+def user(user: User, engine: Engine) -> Generator[User, None, None]:
+    # NiceGUI resets its routes for every test, so pages are registered again; the schema is built once by `engine`
+    register_pages()
     yield user
+
+
+@pytest.fixture()
+def counter_value(user: User) -> Callable[[], str]:
+    """Read the text of the counter's value label exactly; should_see would also match digits in the timestamp."""
+
+    def read() -> str:
+        (label,) = user.find(kind=ui.label, marker=COUNTER_VALUE).elements
+        return label.text
+
+    return read
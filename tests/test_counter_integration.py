@@ -1,17 +1,18 @@
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from app.counter_service import CounterService
 from app.models import CounterCreate, CounterUpdate
-from app.database import reset_db, get_session
+from app.database import ENGINE, truncate_all, get_session, session_scope
 from sqlmodel import select
 from app.models import Counter
 
 
 @pytest.fixture()
-def new_db():
-    """Reset database for clean test state."""
-    reset_db()
+def committed_db(engine):
+    """Empty the tables for tests whose writes must be committed, e.g. from other threads or sessions."""
+    truncate_all()
     yield
-    reset_db()
+    truncate_all()
 
 
 def test_counter_database_persistence(new_db):
@@ -98,6 +99,24 @@ def test_concurrent_counter_operations(new_db):
         assert final_counter.value == 1
 
 
+@pytest.mark.skipif(ENGINE.dialect.name == "sqlite", reason="StaticPool shares one connection across threads")
+def test_parallel_increments_are_not_lost(committed_db):
+    """Test that increments issued from parallel sessions are all applied."""
+    counter = CounterService.create_counter(CounterCreate(name="parallel_test", value=0))
+    counter_id = counter.id
+    assert counter_id is not None
+
+    # Each call runs in its own session; a read-modify-write would drop some of them
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _, cid=counter_id: CounterService.increment_counter(cid), range(40)))
+
+    assert all(result is not None for result in results)
+
+    final_counter = CounterService.get_counter(counter_id)
+    assert final_counter is not None
+    assert final_counter.value == 40
+
+
 def test_counter_timestamp_updates(new_db):
     """Test that updated_at timestamp changes with operations."""
     counter = CounterService.create_counter(CounterCreate(name="timestamp_test", value=0))
@@ -166,3 +185,25 @@ def test_error_handling_with_database(new_db):
     with get_session() as session:
         db_counter = session.get(Counter, non_existent_id)
         assert db_counter is None
+
+
+def test_session_scope_shares_one_session(committed_db):
+    """Test that service calls inside session_scope() reuse a single session."""
+    with session_scope() as scoped_session:
+        with get_session() as session:
+            assert session is scoped_session
+
+        counter = CounterService.create_counter(CounterCreate(name="scoped_test", value=0))
+        assert counter.id is not None
+        CounterService.increment_counter(counter.id)
+        CounterService.increment_counter(counter.id)
+
+        default_counter = CounterService.get_or_create_default_counter()
+        assert default_counter.name == "default"
+
+    # Changes were committed and are visible from a fresh session
+    with get_session() as session:
+        assert session is not scoped_session
+        db_counter = session.get(Counter, counter.id)
+        assert db_counter is not None
+        assert db_counter.value == 2
@@ -0,0 +1,55 @@
+from typing import Callable
+import pytest
+from nicegui.testing import User
+from app.counter_ui import COUNTER_VALUE, DECREMENT_BUTTON, INCREMENT_BUTTON, RESET_BUTTON
+
+# Page rendering and navigation checks; clicking through the counter lives in test_counter_ui
+pytestmark = pytest.mark.usefixtures("new_db")
+
+
+async def test_home_page_navigation(user: User) -> None:
+    """Test navigation from home page to counter and that the counter page loads correctly."""
+    await user.open("/")
+
+    # Check home page elements
+    await user.should_see("Welcome to the Counter App")
+    await user.should_see("Get Started")
+
+    # Click the link to counter app
+    user.find("Open Counter App →").click()
+
+    # Should navigate to counter page with all of its elements present
+    await user.should_see("Counter Application")
+    await user.should_see("Count:")
+    await user.should_see(marker=COUNTER_VALUE)
+    await user.should_see(marker=INCREMENT_BUTTON)
+    await user.should_see(marker=DECREMENT_BUTTON)
+    await user.should_see(marker=RESET_BUTTON)
+
+
+@pytest.mark.parametrize(
+    "seed,expected,value",
+    [
+        (None, ["Counter Not Found", "Counter with ID {id} does not exist.", "← Go to Default Counter"], None),
+        (("test_counter", 10), ["Counter Application", "Counter: test_counter"], "10"),
+    ],
+    ids=["not_found", "exists"],
+)
+async def test_specific_counter_page(
+    user: User,
+    seed_counter: Callable[[str, int], int],
+    counter_value: Callable[[], str],
+    seed: tuple[str, int] | None,
+    expected: list[str],
+    value: str | None,
+) -> None:
+    """Test accessing a counter by ID, with and without a matching row."""
+    counter_id = seed_counter(*seed) if seed is not None else 99999
+
+    await user.open(f"/counter/{counter_id}")
+
+    for text in expected:
+        await user.should_see(text.format(id=counter_id))
+
+    if value is not None:
+        assert counter_value() == value
@@ -1,16 +1,8 @@
-import pytest
 from datetime import datetime
+import pytest
 from app.counter_service import CounterService
-from app.models import CounterCreate, CounterUpdate
-from app.database import reset_db
-
-
-@pytest.fixture()
-def new_db():
-    """Reset database for clean test state."""
-    reset_db()
-    yield
-    reset_db()
+from app.models import Counter, CounterCreate, CounterUpdate
+from app.database import get_session
 
 
 def test_get_or_create_default_counter(new_db):
@@ -29,6 +21,25 @@ def test_get_or_create_default_counter(new_db):
     assert counter2.value == counter1.value
 
 
+def test_get_or_create_default_counter_stale_cache(new_db):
+    """Test that a cached default counter id is not trusted once that row stops being the default."""
+    first = CounterService.get_or_create_default_counter()
+    assert first.id is not None
+
+    # The cached row no longer is the default counter
+    with get_session() as session:
+        db_counter = session.get(Counter, first.id)
+        assert db_counter is not None
+        db_counter.name = "renamed"
+        session.add(db_counter)
+        session.commit()
+
+    default_counter = CounterService.get_or_create_default_counter()
+    assert default_counter.name == "default"
+    assert default_counter.value == 0
+    assert default_counter.id != first.id
+
+
 def test_create_counter(new_db):
     """Test creating a new counter."""
     counter_data = CounterCreate(name="test_counter", value=5)
@@ -42,6 +53,18 @@ def test_create_counter(new_db):
     assert isinstance(counter.updated_at, datetime)
 
 
+def test_create_counter_duplicate_name(new_db):
+    """Test that counter names are unique, including the default one."""
+    CounterService.get_or_create_default_counter()
+
+    with pytest.raises(ValueError):
+        CounterService.create_counter(CounterCreate())
+
+    # The failed insert is rolled back and the session stays usable
+    counter = CounterService.create_counter(CounterCreate(name="after_duplicate", value=1))
+    assert counter.id is not None
+
+
 def test_get_counter(new_db):
     """Test getting a counter by ID."""
     # Create a counter first
@@ -134,6 +157,17 @@ def test_update_counter(new_db):
     assert result is None
 
 
+def test_update_counter_same_value(new_db):
+    """Test that updating a counter to its current value does not touch it."""
+    counter = CounterService.create_counter(CounterCreate(name="same_value_test", value=7))
+
+    if counter.id is not None:
+        unchanged_counter = CounterService.update_counter(counter.id, CounterUpdate(value=7))
+        assert unchanged_counter is not None
+        assert unchanged_counter.value == 7
+        assert unchanged_counter.updated_at == counter.updated_at
+
+
 def test_reset_counter(new_db):
     """Test resetting a counter to zero."""
     # Create a counter with non-zero value
@@ -186,6 +220,19 @@ def test_multiple_counters(new_db):
         assert final_default.value == 1
 
 
+def test_list_counters(new_db):
+    """Test listing all counters."""
+    assert CounterService.list_counters() == []
+
+    counter1 = CounterService.create_counter(CounterCreate(name="counter1", value=1))
+    counter2 = CounterService.create_counter(CounterCreate(name="counter2", value=2))
+    default_counter = CounterService.get_or_create_default_counter()
+
+    counters = CounterService.list_counters()
+    assert [counter.id for counter in counters] == [counter1.id, counter2.id, default_counter.id]
+    assert [counter.value for counter in counters] == [1, 2, 0]
+
+
 def test_counter_persistence(new_db):
     """Test that counter changes persist across service calls."""
     # Create and modify a counter
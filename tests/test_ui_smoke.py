@@ -62,7 +62,7 @@ def find_navigable_elements(user: User) -> Dict[str, List[str]]:
 
 
 @pytest.mark.asyncio
-async def test_all_pages_smoke_fast(user: User):
+async def test_all_pages_smoke_fast(user: User, new_db):
     """Fast smoke test using user fixture - checks all reachable pages"""
     visited: Set[str] = set()
     queue = deque(["/"])